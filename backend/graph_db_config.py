@@ -18,6 +18,11 @@ NEO4J_URI = os.getenv("NEO4J_URI")
 NEO4J_USERNAME = os.getenv("NEO4J_USERNAME")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
 
+# Driver connection pool tuning
+NEO4J_MAX_POOL_SIZE = int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
+NEO4J_MAX_CONNECTION_LIFETIME = int(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+NEO4J_ACQUISITION_TIMEOUT = int(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "10"))
+
 # Singleton instance
 _graphdb_instance = None
 
@@ -28,7 +33,13 @@ class GraphDB:
     def __init__(self, uri: str, username: str, password: str):
         """Initialize Neo4j driver"""
         try:
-            self.driver = GraphDatabase.driver(uri, auth=(username, password))
+            self.driver = GraphDatabase.driver(
+                uri,
+                auth=(username, password),
+                max_connection_pool_size=NEO4J_MAX_POOL_SIZE,
+                max_connection_lifetime=NEO4J_MAX_CONNECTION_LIFETIME,
+                connection_acquisition_timeout=NEO4J_ACQUISITION_TIMEOUT,
+            )
             # Test connection
             self.driver.verify_connectivity()
             logger.info(f"✅ Connected to Neo4j at {uri}")
@@ -49,12 +60,13 @@ class GraphDB:
             return [record.data() for record in result]
 
     def execute_write(self, query: str, parameters: dict = None):
-        """Execute a write transaction"""
+        """Execute a write transaction and return the records it produced"""
         with self.driver.session() as session:
-            result = session.write_transaction(
-                lambda tx: tx.run(query, parameters or {})
+            # Consume the result inside the transaction; a Result is no longer
+            # readable once the transaction function has returned.
+            return session.execute_write(
+                lambda tx: [record.data() for record in tx.run(query, parameters or {})]
             )
-            return result
 
 
 def get_graphdb() -> GraphDB: